@@ -28,6 +28,27 @@ class FederatedLearningDemo:
         self.clients_selected_per_round = 3
         self.total_rounds = 5
         
+        # Single random generator reused for client selection and noise
+        self.rng = np.random.default_rng()
+        
+        # Pre-draw every round's client selection and accuracy noise
+        # (columns: base, path, music)
+        self.round_selections = [
+            self.rng.choice(self.num_clients, size=self.clients_selected_per_round, replace=False)
+            for _ in range(self.total_rounds)
+        ]
+        self.round_noise = self.rng.uniform(-0.02, 0.02, size=(self.total_rounds, 3))
+        
+        # Simulated accuracy schedule (improves over rounds), built once
+        self.base_accuracy_curve = 0.65 + 0.03 * np.arange(self.total_rounds)
+        
+        # Training progress frames: (percent, servo angle in 45°-135° range)
+        training_steps = 5
+        self.training_progress = []
+        for step in range(training_steps):
+            progress = int((step + 1) / training_steps * 100)
+            self.training_progress.append((progress, 45 + (progress / 100) * 90))
+        
         # Metrics
         self.round_accuracies = []
     
@@ -66,11 +87,7 @@ class FederatedLearningDemo:
         time.sleep(0.5)
         
         # Client selection
-        selected_clients = np.random.choice(
-            self.num_clients, 
-            size=self.clients_selected_per_round, 
-            replace=False
-        )
+        selected_clients = self.round_selections[round_num - 1]
         
         self.hardware.display_message(
             f"Round {round_num}\n"
@@ -100,16 +117,13 @@ class FederatedLearningDemo:
             time.sleep(0.3)
         
         # Simulate training progress with servo showing progress
-        training_steps = 5
-        for step in range(training_steps):
-            progress = int((step + 1) / training_steps * 100)
+        for progress, progress_angle in self.training_progress:
             self.hardware.display_message(
                 f"Round {round_num}\n"
                 f"Training: {progress}%\n"
                 f"Privacy: Active"
             )
-            # Servo angle represents training progress (45° to 135° range)
-            progress_angle = 45 + (progress / 100) * 90
+            # Servo angle represents training progress
             self.hardware.set_servo_angle(progress_angle)
             time.sleep(0.3)
         
@@ -122,11 +136,12 @@ class FederatedLearningDemo:
         time.sleep(0.8)
         
         # Calculate simulated accuracy (improving over rounds)
-        base_accuracy = 0.65 + (round_num - 1) * 0.03 + np.random.uniform(-0.02, 0.02)
+        base_noise, path_noise, music_noise = self.round_noise[round_num - 1]
+        base_accuracy = self.base_accuracy_curve[round_num - 1] + base_noise
         base_accuracy = min(0.95, max(0.60, base_accuracy))
         
-        path_acc = base_accuracy + np.random.uniform(-0.02, 0.02)
-        music_acc = base_accuracy + np.random.uniform(-0.02, 0.02)
+        path_acc = base_accuracy + path_noise
+        music_acc = base_accuracy + music_noise
         combined_acc = (path_acc + music_acc) / 2
         
         self.round_accuracies.append({
@@ -9,10 +9,24 @@ Date: 2025
 """
 
 import time
+from dataclasses import dataclass
 import numpy as np
 from hardware_controller import HardwareController
 
 
+@dataclass
+class POI:
+    """A point of interest relative to the vehicle."""
+    __slots__ = ('name', 'category', 'distance', 'rating', 'area', 'bearing')
+    
+    name: str
+    category: str
+    distance: float  # km
+    rating: float
+    area: str
+    bearing: int  # 0°=North, 90°=East, 180°=South (servo range)
+
+
 class POINavigationDemo:
     """
     Demonstrates POI finding and navigation with music recommendations.
@@ -33,20 +47,24 @@ class POINavigationDemo:
         # NYC POIs with realistic locations, data, and bearing angles
         # Bearing: 0°=North, 90°=East, 180°=South, 270°=West (mapped to 0-180° servo range)
         self.nyc_pois = [
-            {"name": "Central Park", "category": "Park", "distance": 2.3, "rating": 4.8, "area": "Manhattan", "bearing": 45},  # Northeast
-            {"name": "Times Square", "category": "Shopping", "distance": 1.2, "rating": 4.5, "area": "Manhattan", "bearing": 0},  # North
-            {"name": "Empire State Bldg", "category": "Museum", "distance": 0.8, "rating": 4.7, "area": "Manhattan", "bearing": 90},  # East
-            {"name": "Broadway Theater", "category": "Theater", "distance": 1.5, "rating": 4.9, "area": "Manhattan", "bearing": 135},  # Southeast
-            {"name": "AMC Cinema", "category": "Cinema", "distance": 3.1, "rating": 4.4, "area": "Manhattan", "bearing": 180},  # South
-            {"name": "NY Public Library", "category": "Library", "distance": 1.8, "rating": 4.6, "area": "Manhattan", "bearing": 22},  # North-Northeast
-            {"name": "JFK Airport", "category": "Airport", "distance": 15.2, "rating": 4.3, "area": "Queens", "bearing": 90},  # East
-            {"name": "Coney Island", "category": "Beach", "distance": 12.5, "rating": 4.2, "area": "Brooklyn", "bearing": 180},  # South
-            {"name": "Grand Central", "category": "Train Station", "distance": 0.5, "rating": 4.7, "area": "Manhattan", "bearing": 45},  # Northeast
-            {"name": "Joe's Pizza", "category": "Restaurant", "distance": 2.1, "rating": 4.6, "area": "Manhattan", "bearing": 67},  # East-Northeast
-            {"name": "MoMA", "category": "Museum", "distance": 2.8, "rating": 4.8, "area": "Manhattan", "bearing": 112},  # East-Southeast
-            {"name": "Brooklyn Bridge", "category": "Park", "distance": 3.5, "rating": 4.9, "area": "Brooklyn", "bearing": 157},  # South-Southeast
+            POI("Central Park", "Park", 2.3, 4.8, "Manhattan", 45),  # Northeast
+            POI("Times Square", "Shopping", 1.2, 4.5, "Manhattan", 0),  # North
+            POI("Empire State Bldg", "Museum", 0.8, 4.7, "Manhattan", 90),  # East
+            POI("Broadway Theater", "Theater", 1.5, 4.9, "Manhattan", 135),  # Southeast
+            POI("AMC Cinema", "Cinema", 3.1, 4.4, "Manhattan", 180),  # South
+            POI("NY Public Library", "Library", 1.8, 4.6, "Manhattan", 22),  # North-Northeast
+            POI("JFK Airport", "Airport", 15.2, 4.3, "Queens", 90),  # East
+            POI("Coney Island", "Beach", 12.5, 4.2, "Brooklyn", 180),  # South
+            POI("Grand Central", "Train Station", 0.5, 4.7, "Manhattan", 45),  # Northeast
+            POI("Joe's Pizza", "Restaurant", 2.1, 4.6, "Manhattan", 67),  # East-Northeast
+            POI("MoMA", "Museum", 2.8, 4.8, "Manhattan", 112),  # East-Southeast
+            POI("Brooklyn Bridge", "Park", 3.5, 4.9, "Brooklyn", 157),  # South-Southeast
         ]
         
+        # Ranking fields as parallel arrays (index-aligned with nyc_pois)
+        self.poi_distances = np.array([poi.distance for poi in self.nyc_pois])
+        self.poi_ratings = np.array([poi.rating for poi in self.nyc_pois])
+        
         # NYC music genres and tracks (based on NYC music data)
         self.music_genres = [
             "Jazz", "Hip Hop", "Rock", "Electronic", "R&B",
@@ -57,48 +75,82 @@ class POINavigationDemo:
         self.music_by_category = {
             "Park": {
                 "genre": "Indie",
-                "tracks": ["Central Park", "Brooklyn Nights", "NYC Dreams"]
+                "tracks": ("Central Park", "Brooklyn Nights", "NYC Dreams")
             },
             "Shopping": {
                 "genre": "Hip Hop",
-                "tracks": ["Empire State", "Big Apple", "City Lights"]
+                "tracks": ("Empire State", "Big Apple", "City Lights")
             },
             "Museum": {
                 "genre": "Classical",
-                "tracks": ["Museum Walk", "Art Gallery", "Cultural Vibes"]
+                "tracks": ("Museum Walk", "Art Gallery", "Cultural Vibes")
             },
             "Theater": {
                 "genre": "Jazz",
-                "tracks": ["Broadway Blues", "Showtime", "Stage Lights"]
+                "tracks": ("Broadway Blues", "Showtime", "Stage Lights")
             },
             "Cinema": {
                 "genre": "Electronic",
-                "tracks": ["Movie Magic", "Screen Time", "Cinema Vibes"]
+                "tracks": ("Movie Magic", "Screen Time", "Cinema Vibes")
             },
             "Restaurant": {
                 "genre": "Jazz",
-                "tracks": ["Dinner Music", "NYC Bistro", "City Eats"]
+                "tracks": ("Dinner Music", "NYC Bistro", "City Eats")
             },
             "Train Station": {
                 "genre": "Rock",
-                "tracks": ["Subway Song", "Train Tracks", "Metro Beat"]
+                "tracks": ("Subway Song", "Train Tracks", "Metro Beat")
             },
             "Library": {
                 "genre": "Classical",
-                "tracks": ["Quiet Study", "Reading Room", "Knowledge"]
+                "tracks": ("Quiet Study", "Reading Room", "Knowledge")
             },
             "Airport": {
                 "genre": "Electronic",
-                "tracks": ["Takeoff", "Flight Mode", "Departure"]
+                "tracks": ("Takeoff", "Flight Mode", "Departure")
             },
             "Beach": {
                 "genre": "Reggae",
-                "tracks": ["Beach Vibes", "Ocean Waves", "Summer NY"]
+                "tracks": ("Beach Vibes", "Ocean Waves", "Summer NY")
             }
         }
         
+        # Fallback for categories without a mapping (shared, never rebuilt)
+        self.MUSIC_DEFAULT = {
+            "genre": "Jazz",
+            "tracks": ("NYC Vibes", "City Sounds", "Urban Beat")
+        }
+        
+        # Cardinal direction for every half degree of bearing (0-180°);
+        # half-degree steps keep the 22.5° sector boundaries exact
+        self.BEARING_LUT = tuple(
+            "N" if b < 22.5 else
+            "NE" if b < 67.5 else
+            "E" if b < 112.5 else
+            "SE" if b < 157.5 else
+            "S"
+            for b in (i / 2 for i in range(361))
+        )
+        
+        # Servo ramps keyed by (start, end, steps), reused across animations
+        self.servo_ramps = {}
+        
+        # Repeated servo sweeps as single angle sequences
+        self.MUSIC_SWEEP = (
+            HardwareController.servo_ramp(60, 120, 6) + HardwareController.servo_ramp(120, 60, 6)
+        ) * 3
+        self.CELEBRATION_SWEEP = (
+            HardwareController.servo_ramp(0, 180, 20) + HardwareController.servo_ramp(180, 0, 20)
+        ) * 2
+        
         # Current location (NYC - Manhattan center)
         self.current_location = (40.7589, -73.9851)  # Times Square area
+        
+        # Single random generator reused for navigation route variations
+        self.rng = np.random.default_rng()
+        
+        # POI table and location are static, so rank recommendations once
+        self.recommended_pois = self._rank_pois()
     
     def run(self):
         """Run the POI navigation demo."""
@@ -106,7 +158,7 @@ class POINavigationDemo:
         time.sleep(1)
         
         # Animate servo
-        self.hardware.servo_animation(0, 90, 10, 0.05)
+        self._animate_servo(0, 90, 10, 0.05)
         
         # Show welcome
         self.hardware.display_message("NYC POI & Navigation\nDemo\n\nPress any key\nto start")
@@ -145,7 +197,7 @@ class POINavigationDemo:
             "Traffic: Moderate"
         )
         # Servo sweeps to show analysis in progress
-        self.hardware.servo_animation(45, 135, 8, 0.03)
+        self._animate_servo(45, 135, 8, 0.03)
         time.sleep(2)
         
         self.hardware.display_message(
@@ -163,58 +215,51 @@ class POINavigationDemo:
             "Using FL model..."
         )
         
-        # Simulate model inference - select POIs based on context
-        # In real system, this would use the FL model
-        # For demo: prioritize nearby, high-rated POIs
-        
-        # Filter by distance and rating
-        nearby_pois = [poi for poi in self.nyc_pois if poi['distance'] < 5.0]
-        nearby_pois.sort(key=lambda x: (x['distance'], -x['rating']))
-        
-        # Select top 3
-        recommended_pois = nearby_pois[:3]
-        
-        # If not enough nearby, add some popular ones
-        if len(recommended_pois) < 3:
-            popular = sorted(self.nyc_pois, key=lambda x: -x['rating'])[:3]
-            for poi in popular:
-                if poi not in recommended_pois:
-                    recommended_pois.append(poi)
-                    if len(recommended_pois) >= 3:
-                        break
-        
-        recommended_pois = recommended_pois[:3]
-        
         # Servo sweeps to show POI search in progress
-        self.hardware.servo_animation(135, 45, 10, 0.03)
+        self._animate_servo(135, 45, 10, 0.03)
         # Return to center after search
         self.hardware.set_servo_angle(90)
         time.sleep(1)
         
-        return recommended_pois
+        return self.recommended_pois
     
-    def _display_poi_recommendations(self, pois):
-        """Display POI recommendations."""
-        self.hardware.display_message(
-            "Top Recommendations:\n\n"
-            f"4. {pois[0]['name']}\n"
-            f"   {pois[0]['distance']}km, {pois[0]['rating']}★"
-        )
-        time.sleep(2)
+    def _rank_pois(self):
+        """
+        Rank POIs for the current context (simulated FL inference).
         
-        if len(pois) > 1:
-            self.hardware.display_message(
-                "Top Recommendations:\n\n"
-                f"5. {pois[1]['name']}\n"
-                f"   {pois[1]['distance']}km, {pois[1]['rating']}★"
-            )
-            time.sleep(2)
+        Returns:
+            Top 3 POIs: nearby first (closest, then best rated),
+            topped up with the most popular POIs if needed
+        """
+        # In real system, this would use the FL model
+        # For demo: prioritize nearby, high-rated POIs
         
-        if len(pois) > 2:
+        # Select top 3 nearby POIs (closest first, then best rated)
+        nearby = np.flatnonzero(self.poi_distances < 5.0)
+        order = np.lexsort((-self.poi_ratings[nearby], self.poi_distances[nearby]))
+        recommended_idx = nearby[order[:3]].tolist()
+        
+        # If not enough nearby, add some popular ones (set of indices
+        # for O(1) membership instead of comparing POI records)
+        if len(recommended_idx) < 3:
+            seen = set(recommended_idx)
+            for i in np.argsort(-self.poi_ratings, kind='stable')[:3].tolist():
+                if i not in seen:
+                    seen.add(i)
+                    recommended_idx.append(i)
+                    if len(recommended_idx) >= 3:
+                        break
+        
+        return [self.nyc_pois[i] for i in recommended_idx]
+    
+    def _display_poi_recommendations(self, pois):
+        """Display POI recommendations."""
+        # Keys 4-6 select the first three POIs
+        for key, poi in enumerate(pois[:3], 4):
             self.hardware.display_message(
                 "Top Recommendations:\n\n"
-                f"6. {pois[2]['name']}\n"
-                f"   {pois[2]['distance']}km, {pois[2]['rating']}★"
+                f"{key}. {poi.name}\n"
+                f"   {poi.distance}km, {poi.rating}★"
             )
             time.sleep(2)
     
@@ -233,20 +278,20 @@ class POINavigationDemo:
             if idx < len(pois):
                 selected = pois[idx]
                 self.hardware.display_message(
-                    f"Selected:\n{selected['name']}\n\n"
-                    f"Distance: {selected['distance']}km"
+                    f"Selected:\n{selected.name}\n\n"
+                    f"Distance: {selected.distance}km"
                 )
                 # Point servo in direction of selected POI
-                bearing = selected.get('bearing', 90)
-                self.hardware.servo_animation(90, bearing, 10, 0.03)
+                bearing = selected.bearing
+                self._animate_servo(90, bearing, 10, 0.03)
                 time.sleep(1.5)
                 return selected
         
         # Default to first POI
         selected = pois[0]
         # Point servo in direction of default POI
-        bearing = selected.get('bearing', 90)
-        self.hardware.servo_animation(90, bearing, 10, 0.03)
+        bearing = selected.bearing
+        self._animate_servo(90, bearing, 10, 0.03)
         return selected
     
     def _navigate_to_poi(self, poi):
@@ -254,30 +299,34 @@ class POINavigationDemo:
         Simulate navigation to POI with directional servo pointing.
         Servo acts as a compass, pointing in the direction of the destination.
         """
-        bearing = poi.get('bearing', 90)  # Direction to POI (0-180°)
+        bearing = poi.bearing  # Direction to POI (0-180°)
         
         self.hardware.display_message(
             "Starting Navigation\n\n"
-            f"Destination:\n{poi['name']}\n"
-            f"Distance: {poi['distance']}km"
+            f"Destination:\n{poi.name}\n"
+            f"Distance: {poi.distance}km"
         )
         # Point servo in initial direction
-        self.hardware.servo_animation(90, bearing, 10, 0.05)
+        self._animate_servo(90, bearing, 10, 0.05)
         time.sleep(1.5)
         
         # Simulate navigation progress with directional updates
         steps = 8
         current_bearing = bearing
         
-        for i in range(steps):
-            progress = int((i + 1) / steps * 100)
-            distance_remaining = poi['distance'] * (1 - (i + 1) / steps)
-            
-            # Simulate slight direction changes during navigation (realistic route adjustments)
-            # Add small variations to simulate turns and route corrections
-            bearing_variation = np.random.uniform(-10, 10)
-            target_bearing = max(0, min(180, bearing + bearing_variation))
-            
+        # Whole step schedule at once: fraction of route covered per step
+        fractions = np.arange(1, steps + 1) / steps
+        progress_pcts = (fractions * 100).astype(int)
+        distances_remaining = poi.distance * (1 - fractions)
+        
+        # Simulate slight direction changes during navigation (realistic route adjustments)
+        # Add small variations to simulate turns and route corrections
+        bearing_variations = self.rng.uniform(-10, 10, size=steps)
+        target_bearings = np.clip(bearing + bearing_variations, 0, 180)
+        
+        for progress, distance_remaining, target_bearing in zip(
+            progress_pcts.tolist(), distances_remaining.tolist(), target_bearings.tolist()
+        ):
             self.hardware.display_message(
                 f"Navigating...\n\n"
                 f"Progress: {progress}%\n"
@@ -286,6 +335,7 @@ class POINavigationDemo:
             )
             
             # Smoothly update servo to point in current direction
+            # (random per-step bearings never repeat, so not cached)
             self.hardware.servo_animation(current_bearing, target_bearing, 5, 0.05)
             current_bearing = target_bearing
             time.sleep(0.6)
@@ -296,27 +346,26 @@ class POINavigationDemo:
         
         self.hardware.display_message(
             "Arrived!\n\n"
-            f"Welcome to\n{poi['name']}"
+            f"Welcome to\n{poi.name}"
         )
         
         # Success animation - quick sweep to celebrate arrival
-        self.hardware.servo_animation(bearing, bearing + 30, 5, 0.02)
-        self.hardware.servo_animation(bearing + 30, bearing - 30, 5, 0.02)
-        self.hardware.servo_animation(bearing - 30, bearing, 5, 0.02)
+        self._animate_servo(bearing, bearing + 30, 5, 0.02)
+        self._animate_servo(bearing + 30, bearing - 30, 5, 0.02)
+        self._animate_servo(bearing - 30, bearing, 5, 0.02)
         time.sleep(2)
     
+    def _animate_servo(self, start_angle, end_angle, steps, delay):
+        """Animate servo, reusing the cached angle ramp for these endpoints."""
+        key = (start_angle, end_angle, steps)
+        ramp = self.servo_ramps.get(key)
+        if ramp is None:
+            ramp = self.servo_ramps[key] = HardwareController.servo_ramp(start_angle, end_angle, steps)
+        self.hardware.servo_sweep(ramp, delay)
+    
     def _bearing_to_direction(self, bearing):
         """Convert bearing angle to cardinal direction string."""
-        if bearing < 22.5:
-            return "N"
-        elif bearing < 67.5:
-            return "NE"
-        elif bearing < 112.5:
-            return "E"
-        elif bearing < 157.5:
-            return "SE"
-        else:
-            return "S"
+        return self.BEARING_LUT[max(0, min(360, int(bearing * 2)))]
     
     def _show_music_recommendations(self, poi):
         """Show music recommendations based on context."""
@@ -327,10 +376,7 @@ class POINavigationDemo:
         time.sleep(1)
         
         # Get music for POI category
-        music_info = self.music_by_category.get(
-            poi['category'],
-            {"genre": "Jazz", "tracks": ["NYC Vibes", "City Sounds", "Urban Beat"]}
-        )
+        music_info = self.music_by_category.get(poi.category, self.MUSIC_DEFAULT)
         
         self.hardware.display_message(
             "Recommended Music:\n\n"
@@ -340,9 +386,7 @@ class POINavigationDemo:
         )
         
         # Animate servo to music rhythm (gentle back-and-forth)
-        for _ in range(3):
-            self.hardware.servo_animation(60, 120, 6, 0.08)
-            self.hardware.servo_animation(120, 60, 6, 0.08)
+        self.hardware.servo_sweep(self.MUSIC_SWEEP, 0.08)
         
         # Return to center after music animation
         self.hardware.set_servo_angle(90)
@@ -360,8 +404,8 @@ class POINavigationDemo:
         """Show complete journey summary."""
         self.hardware.display_message(
             "Journey Summary\n\n"
-            f"Destination: {poi['name']}\n"
-            f"Distance: {poi['distance']}km\n"
+            f"Destination: {poi.name}\n"
+            f"Distance: {poi.distance}km\n"
             f"Status: Complete"
         )
         time.sleep(2)
@@ -375,9 +419,7 @@ class POINavigationDemo:
         )
         
         # Final celebration animation - full sweep
-        for _ in range(2):
-            self.hardware.servo_animation(0, 180, 20, 0.02)
-            self.hardware.servo_animation(180, 0, 20, 0.02)
+        self.hardware.servo_sweep(self.CELEBRATION_SWEEP, 0.02)
         # Return to center/ready position
         self.hardware.set_servo_angle(90)
         
@@ -9,7 +9,7 @@ Date: 2025
 
 import time
 import threading
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterable
 from queue import Queue
 
 try:
@@ -70,6 +70,9 @@ class HardwareController:
         self.OLED_HEIGHT = 64
         self.OLED_ADDRESS = 0x3C
         
+        # Last message flushed to the OLED (skips identical I2C redraws)
+        self._last_message: Optional[str] = None
+        
         # Initialize components
         self._init_gpio()
         self._init_oled()
@@ -189,7 +192,7 @@ class HardwareController:
                 
                 # Handle key press with debouncing
                 if key_pressed and key_pressed != last_key:
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if current_time - last_press_time > debounce_time:
                         if key_pressed:  # Only process valid keys (not None)
                             self.keypad_queue.put(key_pressed)
@@ -225,6 +228,10 @@ class HardwareController:
             print(f"[OLED] {message}")
             return
         
+        # Screen already shows this exact frame; skip the full I2C flush
+        if clear and message == self._last_message:
+            return
+        
         try:
             if clear:
                 self.draw.rectangle((0, 0, self.OLED_WIDTH, self.OLED_HEIGHT), outline=0, fill=0)
@@ -246,7 +253,9 @@ class HardwareController:
             # Display on OLED
             self.oled.image(self.image)
             self.oled.show()
+            self._last_message = message if clear else None
         except Exception as e:
+            self._last_message = None
             print(f"OLED display error: {e}")
     
     def display_menu(self, title: str, options: list):
@@ -295,8 +304,32 @@ class HardwareController:
             steps: Number of animation steps
             delay: Delay between steps
         """
-        for i in range(steps + 1):
-            angle = start_angle + (end_angle - start_angle) * (i / steps)
+        self.servo_sweep(self.servo_ramp(start_angle, end_angle, steps), delay)
+    
+    @staticmethod
+    def servo_ramp(start_angle: float, end_angle: float, steps: int = 10) -> tuple:
+        """
+        Compute the angles visited by servo_animation.
+        
+        Args:
+            start_angle: Starting angle
+            end_angle: Ending angle
+            steps: Number of animation steps
+            
+        Returns:
+            Tuple of steps + 1 angles, including both endpoints
+        """
+        return tuple(start_angle + (end_angle - start_angle) * (i / steps) for i in range(steps + 1))
+    
+    def servo_sweep(self, angles: Iterable[float], delay: float = 0.05):
+        """
+        Move servo through a precomputed sequence of angles.
+        
+        Args:
+            angles: Angles in degrees (0-180), visited in order
+            delay: Delay after each step
+        """
+        for angle in angles:
             self.set_servo_angle(angle)
             time.sleep(delay)
     
@@ -336,6 +369,7 @@ class HardwareController:
     
     def clear_display(self):
         """Clear OLED display."""
+        self._last_message = None
         if not self.simulation_mode and self.oled and self.draw:
             try:
                 self.draw.rectangle((0, 0, self.OLED_WIDTH, self.OLED_HEIGHT), outline=0, fill=0)
@@ -378,8 +412,8 @@ if __name__ == "__main__":
     print("Keypad test (press keys, or 'q' to quit):")
     controller.set_keypad_callback(lambda key: print(f"Key pressed: {key}"))
     
-    start_time = time.time()
-    while time.time() - start_time < 10:
+    start_time = time.monotonic()
+    while time.monotonic() - start_time < 10:
         key = controller.get_key(timeout=1.0)
         if key:
             print(f"Got key: {key}")
@@ -8,17 +8,7 @@ Author: FedRoute Team
 Date: 2025
 """
 
-import sys
 import time
-from pathlib import Path
-
-# Add hardware_demo to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
-from hardware_controller import HardwareController
-from demo_federated_learning import FederatedLearningDemo
-from demo_poi_navigation import POINavigationDemo
-from demo_system_info import SystemInfoDemo
 
 
 class FedRouteHardwareDemo:
@@ -28,6 +18,9 @@ class FedRouteHardwareDemo:
     
     def __init__(self, simulation_mode: bool = False):
         """Initialize main demo."""
+        # Imported here so `--help` does not probe GPIO/OLED libraries
+        from hardware_controller import HardwareController
+        
         self.hardware = HardwareController(simulation_mode=simulation_mode)
         self.running = True
         
@@ -38,6 +31,12 @@ class FedRouteHardwareDemo:
             "System Information"
         ]
         
+        # Menu screen is static, so build it once
+        # Use keys 4, 5, 6 (since 1, 2, 3 don't work)
+        self.menu_text = "Main Menu\n\n" + "".join(
+            f"{i}. {option}\n" for i, option in enumerate(self.menu_options, 4)
+        ) + "\n* = Exit"
+        
         print("\n" + "="*60)
         print("🚀 FedRoute Hardware Demo")
         print("="*60)
@@ -108,13 +107,7 @@ class FedRouteHardwareDemo:
     
     def _show_main_menu(self):
         """Display main menu."""
-        menu_text = "Main Menu\n\n"
-        # Use keys 4, 5, 6 (since 1, 2, 3 don't work)
-        for i, option in enumerate(self.menu_options, 4):
-            menu_text += f"{i}. {option}\n"
-        menu_text += "\n* = Exit"
-        
-        self.hardware.display_message(menu_text)
+        self.hardware.display_message(self.menu_text)
         
         # Menu indicator animation
         self.hardware.servo_animation(90, 135, 5, 0.05)
@@ -139,6 +132,7 @@ class FedRouteHardwareDemo:
     def _run_fl_demo(self):
         """Run federated learning demo."""
         try:
+            from demo_federated_learning import FederatedLearningDemo
             demo = FederatedLearningDemo(self.hardware)
             demo.run()
         except Exception as e:
@@ -152,6 +146,7 @@ class FedRouteHardwareDemo:
     def _run_poi_demo(self):
         """Run POI navigation demo."""
         try:
+            from demo_poi_navigation import POINavigationDemo
             demo = POINavigationDemo(self.hardware)
             demo.run()
         except Exception as e:
@@ -165,6 +160,7 @@ class FedRouteHardwareDemo:
     def _run_system_info_demo(self):
         """Run system information demo."""
         try:
+            from demo_system_info import SystemInfoDemo
             demo = SystemInfoDemo(self.hardware)
             demo.run()
         except Exception as e: